@@ -1,9 +1,13 @@
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     List,
     Optional,
     Tuple,
@@ -12,9 +16,11 @@ from typing import (
 )
 
 from robot.parsing.lexer.tokens import Token
+from robot.variables.search import search_variable
 from robotcode.core.lsp.types import Position, Range
 
 from ..utils.ast import range_from_token
+from ..utils.match import normalize
 
 if TYPE_CHECKING:
     from robotcode.robot.diagnostics.library_doc import KeywordDoc, LibraryDoc
@@ -46,11 +52,17 @@ class SourceEntity:
     end_col_offset: int
     source: Optional[str]
 
+    def __post_init__(self) -> None:
+        if self.source is not None:
+            self.source = sys.intern(self.source)
+
+    # cached, the returned range is shared and must not be modified
     @property
+    @single_call
     def range(self) -> Range:
         return Range(
-            start=Position(line=self.line_no - 1, character=self.col_offset),
-            end=Position(line=self.end_line_no - 1, character=self.end_col_offset),
+            Position(self.line_no - 1, self.col_offset),
+            Position(self.end_line_no - 1, self.end_col_offset),
         )
 
     @single_call
@@ -71,38 +83,48 @@ class Import(SourceEntity):
     name: Optional[str]
     name_token: Optional[Token]
 
+    # cached, the returned range is shared and must not be modified
     @property
+    @single_call
     def range(self) -> Range:
+        if self.name_token is not None:
+            return Range(
+                Position(self.name_token.lineno - 1, self.name_token.col_offset),
+                Position(self.name_token.lineno - 1, self.name_token.end_col_offset),
+            )
+
         return Range(
-            start=Position(
-                line=self.name_token.lineno - 1 if self.name_token is not None else self.line_no - 1,
-                character=self.name_token.col_offset if self.name_token is not None else self.col_offset,
-            ),
-            end=Position(
-                line=self.name_token.lineno - 1 if self.name_token is not None else self.end_line_no - 1,
-                character=self.name_token.end_col_offset if self.name_token is not None else self.end_col_offset,
-            ),
+            Position(self.line_no - 1, self.col_offset),
+            Position(self.end_line_no - 1, self.end_col_offset),
         )
 
 
+@lru_cache(maxsize=5000)
+def _intern_args(args: Tuple[str, ...]) -> Tuple[str, ...]:
+    return args
+
+
 @dataclass
 class LibraryImport(Import):
     args: Tuple[str, ...] = ()
     alias: Optional[str] = None
     alias_token: Optional[Token] = None
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.args = _intern_args(tuple(self.args))
+
+    # cached, the returned range is shared and must not be modified
     @property
+    @single_call
     def alias_range(self) -> Range:
-        return Range(
-            start=Position(
-                line=self.alias_token.lineno - 1 if self.alias_token is not None else -1,
-                character=self.alias_token.col_offset if self.alias_token is not None else -1,
-            ),
-            end=Position(
-                line=self.alias_token.lineno - 1 if self.alias_token is not None else -1,
-                character=self.alias_token.end_col_offset if self.alias_token is not None else -1,
-            ),
-        )
+        if self.alias_token is not None:
+            return Range(
+                Position(self.alias_token.lineno - 1, self.alias_token.col_offset),
+                Position(self.alias_token.lineno - 1, self.alias_token.end_col_offset),
+            )
+
+        return Range(Position(-1, -1), Position(-1, -1))
 
     @single_call
     def __hash__(self) -> int:
@@ -120,6 +142,10 @@ class ResourceImport(Import):
 class VariablesImport(Import):
     args: Tuple[str, ...] = ()
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.args = _intern_args(tuple(self.args))
+
     @single_call
     def __hash__(self) -> int:
         return hash((type(self), self.name, self.args))
@@ -129,42 +155,44 @@ class InvalidVariableError(Exception):
     pass
 
 
+_SIMPLE_VARIABLE_PATTERN = re.compile(r"[$@&%]\{([^{}\\]*)\}")
+
+
 class VariableMatcher:
     def __init__(self, name: str) -> None:
-        from robot.variables.search import search_variable
-        from robotcode.robot.utils.match import normalize
-
         self.name = name
 
-        match = search_variable(name, "$@&%", ignore_errors=True)
+        simple_match = _SIMPLE_VARIABLE_PATTERN.fullmatch(name)
+        if simple_match is not None:
+            self.base = simple_match.group(1)
+        else:
+            match = search_variable(name, "$@&%", ignore_errors=True)
 
-        if match.base is None:
-            raise InvalidVariableError(f"Invalid variable '{name}'")
+            if match.base is None:
+                raise InvalidVariableError(f"Invalid variable '{name}'")
 
-        self.base = match.base
+            self.base = match.base
 
         self.normalized_name = str(normalize(self.base))
+        self._hash = hash(self.normalized_name)
 
     def __eq__(self, o: object) -> bool:
-        from robot.utils.normalizing import normalize
-        from robot.variables.search import search_variable
-
         if isinstance(o, VariableMatcher):
             return o.normalized_name == self.normalized_name
 
         if isinstance(o, str):
-            match = search_variable(o, "$@&%", ignore_errors=True)
-            base = match.base
-            if base is None:
-                return False
-
-            normalized = str(normalize(base))
-            return self.normalized_name == normalized
+            return self.match_name(o)
 
         return False
 
+    def match_name(self, name: str) -> bool:
+        try:
+            return self.normalized_name == _get_matcher(name).normalized_name
+        except InvalidVariableError:
+            return False
+
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
 
     def __str__(self) -> str:
         return self.name
@@ -173,6 +201,11 @@ class VariableMatcher:
         return f"{type(self).__name__}(name={self.name!r})"
 
 
+@lru_cache(maxsize=5000)
+def _get_matcher(name: str) -> VariableMatcher:
+    return VariableMatcher(name)
+
+
 class VariableDefinitionType(Enum):
     VARIABLE = "suite variable"
     LOCAL_VARIABLE = "local variable"
@@ -185,12 +218,15 @@ class VariableDefinitionType(Enum):
     ENVIRONMENT_VARIABLE = "environment variable"
     VARIABLE_NOT_FOUND = "variable not found"
 
+    # members are singletons compared by identity, so there is no need for `Enum.__hash__` to hash the name
+    __hash__ = object.__hash__
+
 
 @dataclass
 class VariableDefinition(SourceEntity):
     name: str
     name_token: Optional[Token]
-    type: VariableDefinitionType = VariableDefinitionType.VARIABLE
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.VARIABLE
 
     has_value: bool = field(default=False, compare=False)
     resolvable: bool = field(default=False, compare=False)
@@ -198,92 +234,90 @@ class VariableDefinition(SourceEntity):
     value: Any = field(default=None, compare=False)
     value_is_native: bool = field(default=False, compare=False)
 
-    matcher: VariableMatcher = field(init=False, compare=False)
+    @property
+    @single_call
+    def matcher(self) -> VariableMatcher:
+        return _get_matcher(self.name)
 
-    def __post_init__(self) -> None:
-        self.matcher = VariableMatcher(self.name)
+    # subclasses use `eq=False` to keep this `__eq__` and `__hash__`
+    def __eq__(self, o: object) -> bool:
+        if o.__class__ is not self.__class__:
+            return NotImplemented
+
+        return (
+            self.line_no == o.line_no
+            and self.col_offset == o.col_offset
+            and self.end_line_no == o.end_line_no
+            and self.end_col_offset == o.end_col_offset
+            and self.name == o.name
+            and self.source == o.source
+            and self.name_token == o.name_token
+        )
 
     @single_call
     def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
+        return hash(
+            (
+                type(self),
+                self.name,
+                self.line_no,
+                self.col_offset,
+                self.end_line_no,
+                self.end_col_offset,
+                self.source,
+            )
+        )
 
+    # cached, the returned range is shared and must not be modified
     @property
+    @single_call
     def name_range(self) -> Range:
         if self.name_token is not None:
             return range_from_token(self.name_token)
 
         return self.range
 
-    @property
-    def range(self) -> Range:
-        return Range(
-            start=Position(line=self.line_no - 1, character=self.col_offset),
-            end=Position(line=self.end_line_no - 1, character=self.end_col_offset),
-        )
-
 
-@dataclass
+@dataclass(eq=False)
 class TestVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.TEST_VARIABLE
-
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.TEST_VARIABLE
 
 
-@dataclass
+@dataclass(eq=False)
 class LocalVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.LOCAL_VARIABLE
-
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.LOCAL_VARIABLE
 
 
-@dataclass
+@dataclass(eq=False)
 class GlobalVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.GLOBAL_VARIABLE
-
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.GLOBAL_VARIABLE
 
 
-@dataclass
+@dataclass(eq=False)
 class BuiltInVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.BUILTIN_VARIABLE
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.BUILTIN_VARIABLE
     resolvable: bool = True
 
     @single_call
     def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type))
+        return hash((type(self), self.name))
 
 
-@dataclass
+@dataclass(eq=False)
 class CommandLineVariableDefinition(GlobalVariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.COMMAND_LINE_VARIABLE
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.COMMAND_LINE_VARIABLE
     resolvable: bool = True
 
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
-
 
-@dataclass
+@dataclass(eq=False)
 class ArgumentDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.ARGUMENT
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.ARGUMENT
     keyword_doc: Optional["KeywordDoc"] = field(default=None, compare=False, metadata={"nosave": True})
 
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
-
 
-@dataclass
+@dataclass(eq=False)
 class LibraryArgumentDefinition(ArgumentDefinition):
-    @single_call
-    def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.range, self.source))
+    pass
 
 
 @dataclass(frozen=True, eq=False, repr=False)
@@ -297,36 +331,36 @@ class NativeValue:
         return str(self.value)
 
 
-@dataclass
+@dataclass(eq=False)
 class ImportedVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.IMPORTED_VARIABLE
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.IMPORTED_VARIABLE
     value: Optional[NativeValue] = field(default=None, compare=False)
 
     @single_call
     def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type, self.source))
+        return hash((type(self), self.name, self.source))
 
 
-@dataclass
+@dataclass(eq=False)
 class EnvironmentVariableDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.ENVIRONMENT_VARIABLE
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.ENVIRONMENT_VARIABLE
     resolvable: bool = True
 
     default_value: Any = field(default=None, compare=False)
 
     @single_call
     def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type))
+        return hash((type(self), self.name))
 
 
-@dataclass
+@dataclass(eq=False)
 class VariableNotFoundDefinition(VariableDefinition):
-    type: VariableDefinitionType = VariableDefinitionType.VARIABLE_NOT_FOUND
+    type: ClassVar[VariableDefinitionType] = VariableDefinitionType.VARIABLE_NOT_FOUND
     resolvable: bool = False
 
     @single_call
     def __hash__(self) -> int:
-        return hash((type(self), self.name, self.type))
+        return hash((type(self), self.name))
 
 
 @dataclass
@@ -638,6 +638,8 @@ class KeywordDoc(SourceEntity):
     digest: Optional[str] = field(init=False)
 
     def __post_init__(self) -> None:
+        super().__post_init__()
+
         s = (
             f"{self.name}|{self.source}|{self.line_no}|"
             f"{self.end_line_no}|{self.col_offset}|{self.end_col_offset}|"
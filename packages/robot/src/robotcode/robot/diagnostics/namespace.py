@@ -1139,9 +1139,10 @@ class Namespace:
                     sentinel=self,
                     variables=variables,
                 )
-                result.import_range = value.range
+                # the ranges of an import are cached and shared, so the entry gets its own copies
+                result.import_range = value.range.extend()
                 result.import_source = value.source
-                result.alias_range = value.alias_range
+                result.alias_range = value.alias_range.extend()
 
                 self._import_entries[value] = result
 
@@ -1191,7 +1192,7 @@ class Namespace:
                         base_dir,
                         variables=variables,
                     )
-                    result.import_range = value.range
+                    result.import_range = value.range.extend()
                     result.import_source = value.source
 
                     self._import_entries[value] = result
@@ -1222,7 +1223,7 @@ class Namespace:
                     variables=variables,
                 )
 
-                result.import_range = value.range
+                result.import_range = value.range.extend()
                 result.import_source = value.source
 
                 self._import_entries[value] = result
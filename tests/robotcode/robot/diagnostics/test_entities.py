@@ -0,0 +1,172 @@
+from typing import Any, Callable, Type
+
+import pytest
+from robot.parsing.lexer.tokens import Token
+
+from robotcode.robot.diagnostics.entities import (
+    ArgumentDefinition,
+    BuiltInVariableDefinition,
+    CommandLineVariableDefinition,
+    EnvironmentVariableDefinition,
+    GlobalVariableDefinition,
+    ImportedVariableDefinition,
+    InvalidVariableError,
+    LibraryImport,
+    LocalVariableDefinition,
+    SourceEntity,
+    VariableDefinition,
+    VariableMatcher,
+    VariableNotFoundDefinition,
+)
+from robotcode.robot.diagnostics.library_doc import KeywordDoc
+
+
+@pytest.mark.parametrize(
+    ("name", "other"),
+    [
+        ("${a}", "${a}"),
+        ("${a b}", "${A_B}"),
+        ("${a b}", "${ab}"),
+        ("@{a_b}", "${AB}"),
+        ("&{A B}", "%{a_b}"),
+        ("${a.b}", "${A.B}"),
+        ("${a}[0]", "${A}"),
+        ("${a${b}}", "${A${B}}"),
+    ],
+)
+def test_variable_matcher_equal_names_should_have_equal_hashes(name: str, other: str) -> None:
+    matcher = VariableMatcher(name)
+    other_matcher = VariableMatcher(other)
+
+    assert matcher == other_matcher
+    assert hash(matcher) == hash(other_matcher)
+    assert matcher == other
+    assert matcher.match_name(other)
+    assert {matcher: 1}[other_matcher] == 1
+
+
+@pytest.mark.parametrize(("name", "other"), [("${a}", "${b}"), ("${a}", "a"), ("${a}", 1)])
+def test_variable_matcher_should_not_match_other_names(name: str, other: object) -> None:
+    assert VariableMatcher(name) != other
+
+
+@pytest.mark.parametrize(("name", "other"), [("${a}", "${b}"), ("${a}", "a"), ("${a}", "")])
+def test_variable_matcher_match_name_should_not_match_other_names(name: str, other: str) -> None:
+    assert not VariableMatcher(name).match_name(other)
+
+
+def test_variable_matcher_with_invalid_name_should_raise_error() -> None:
+    with pytest.raises(InvalidVariableError):
+        VariableMatcher("a")
+
+
+def _source(name: str) -> str:
+    return "/".join(["", "path", "to", name])
+
+
+@pytest.mark.parametrize(
+    "create",
+    [
+        lambda source: LocalVariableDefinition(1, 0, 1, 4, source, "${a}", None),
+        lambda source: LibraryImport(1, 0, 1, 10, source, "Collections", None),
+        lambda source: KeywordDoc(1, 0, 1, 10, source, name="Do Something"),
+    ],
+)
+def test_source_entities_with_equal_sources_should_share_the_source_string(
+    create: Callable[[str], SourceEntity],
+) -> None:
+    source = _source("file.robot")
+    other_source = _source("file.robot")
+    assert source is not other_source
+
+    assert create(source).source is create(other_source).source
+
+
+def _variable(cls: Type[VariableDefinition] = LocalVariableDefinition, **kwargs: Any) -> VariableDefinition:
+    values: Any = {
+        "line_no": 1,
+        "col_offset": 0,
+        "end_line_no": 1,
+        "end_col_offset": 4,
+        "source": "/path/to/file.robot",
+        "name": "${a}",
+        "name_token": None,
+        **kwargs,
+    }
+    return cls(**values)
+
+
+@pytest.mark.parametrize(
+    ("cls", "other_cls"),
+    [
+        (VariableDefinition, LocalVariableDefinition),
+        (LocalVariableDefinition, GlobalVariableDefinition),
+        (GlobalVariableDefinition, CommandLineVariableDefinition),
+        (GlobalVariableDefinition, BuiltInVariableDefinition),
+        (ArgumentDefinition, LocalVariableDefinition),
+    ],
+)
+def test_variable_definitions_of_different_types_should_not_be_equal(
+    cls: Type[VariableDefinition], other_cls: Type[VariableDefinition]
+) -> None:
+    assert _variable(cls) != _variable(other_cls)
+    assert _variable(other_cls) != _variable(cls)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"has_value": True},
+        {"resolvable": True},
+        {"value": "value"},
+        {"value_is_native": True},
+    ],
+)
+def test_variable_definitions_should_ignore_non_compared_fields(kwargs: Any) -> None:
+    variable = _variable()
+    other = _variable(**kwargs)
+
+    assert variable == other
+    assert hash(variable) == hash(other)
+
+
+def test_variable_definitions_should_ignore_resolvable_in_subclasses_that_redefine_it() -> None:
+    assert _variable(BuiltInVariableDefinition) == _variable(BuiltInVariableDefinition, resolvable=False)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"line_no": 2},
+        {"col_offset": 1},
+        {"end_line_no": 2},
+        {"end_col_offset": 5},
+        {"source": "/path/to/other.robot"},
+        {"name": "${b}"},
+        {"name_token": Token(Token.VARIABLE, "${a}", 1, 0)},
+    ],
+)
+def test_variable_definitions_with_different_compared_fields_should_not_be_equal(kwargs: Any) -> None:
+    assert _variable() != _variable(**kwargs)
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs"),
+    [
+        (BuiltInVariableDefinition, {"line_no": 2, "source": "/path/to/other.robot"}),
+        (ImportedVariableDefinition, {"line_no": 2}),
+        (EnvironmentVariableDefinition, {"line_no": 2, "default_value": "default"}),
+        (VariableNotFoundDefinition, {"line_no": 2, "source": "/path/to/other.robot"}),
+    ],
+)
+def test_variable_definitions_with_own_hash_should_keep_hash_consistent_with_eq(
+    cls: Type[VariableDefinition], kwargs: Any
+) -> None:
+    variable = _variable(cls)
+    same = _variable(cls)
+    other = _variable(cls, **kwargs)
+
+    assert variable == same
+    assert hash(variable) == hash(same)
+    assert variable != other
+    assert {variable: 1, same: 2, other: 3} == {variable: 2, other: 3}